@@ -295,75 +295,84 @@ class _GasPhaseThermoStateBlock(StateBlock):
 
         # ---------------------------------------------------------------------
         # Initialise values
-        for k in blk.keys():
+        for b in blk.values():
 
-            if hasattr(blk[k], "mw_eqn"):
+            if hasattr(b, "mw_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].mw,
-                            blk[k].mw_eqn)
+                            b.mw,
+                            b.mw_eqn)
 
-            if hasattr(blk[k], "ideal_gas"):
+            if hasattr(b, "ideal_gas"):
                 calculate_variable_from_constraint(
-                            blk[k].dens_mol,
-                            blk[k].ideal_gas)
+                            b.dens_mol,
+                            b.ideal_gas)
 
-            if hasattr(blk[k], "dens_mass_basis"):
+            if hasattr(b, "dens_mass_basis"):
                 calculate_variable_from_constraint(
-                            blk[k].dens_mass,
-                            blk[k].dens_mass_basis)
+                            b.dens_mass,
+                            b.dens_mass_basis)
 
-            if hasattr(blk[k], "mixture_heat_capacity_eqn"):
+            if hasattr(b, "mixture_heat_capacity_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].cp_mol,
-                            blk[k].mixture_heat_capacity_eqn)
+                            b.cp_mol,
+                            b.mixture_heat_capacity_eqn)
 
-            if hasattr(blk[k], "cp_mass_basis"):
+            if hasattr(b, "cp_mass_basis"):
                 calculate_variable_from_constraint(
-                            blk[k].cp_mass,
-                            blk[k].cp_mass_basis)
+                            b.cp_mass,
+                            b.cp_mass_basis)
 
-            if hasattr(blk[k], "visc_d_constraint"):
+            if hasattr(b, "visc_d_constraint"):
                 calculate_variable_from_constraint(
-                            blk[k].visc_d,
-                            blk[k].visc_d_constraint)
+                            b.visc_d,
+                            b.visc_d_constraint)
 
-            if hasattr(blk[k], "therm_cond_constraint"):
+            if hasattr(b, "therm_cond_constraint"):
                 calculate_variable_from_constraint(
-                            blk[k].therm_cond,
-                            blk[k].therm_cond_constraint)
+                            b.therm_cond,
+                            b.therm_cond_constraint)
 
-            if hasattr(blk[k], "mixture_enthalpy_eqn"):
+            if hasattr(b, "mixture_enthalpy_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].enth_mol,
-                            blk[k].mixture_enthalpy_eqn)
+                            b.enth_mol,
+                            b.mixture_enthalpy_eqn)
+
+            # Check which component properties exist once per block rather
+            # than once per component
+            has_comp_conc = hasattr(b, "comp_conc_eqn")
+            has_diffusion_comp = hasattr(b, "diffusion_comp_constraint")
+            has_cp_shomate = hasattr(b, "cp_shomate_eqn")
+            has_enthalpy_shomate = hasattr(b, "enthalpy_shomate_eqn")
 
-            for j in blk[k]._params.component_list:
+            for j in b._params.component_list:
 
-                if hasattr(blk[k], "comp_conc_eqn"):
+                if has_comp_conc:
                     calculate_variable_from_constraint(
-                                blk[k].dens_mol_comp[j],
-                                blk[k].comp_conc_eqn[j])
+                                b.dens_mol_comp[j],
+                                b.comp_conc_eqn[j])
 
-                if hasattr(blk[k], "diffusion_comp_constraint"):
+                if has_diffusion_comp:
                     calculate_variable_from_constraint(
-                                blk[k].diffusion_comp[j],
-                                blk[k].diffusion_comp_constraint[j])
+                                b.diffusion_comp[j],
+                                b.diffusion_comp_constraint[j])
 
-                if hasattr(blk[k], "cp_shomate_eqn"):
+                if has_cp_shomate:
                     calculate_variable_from_constraint(
-                        blk[k].cp_mol_comp[j],
-                        blk[k].cp_shomate_eqn[j])
+                        b.cp_mol_comp[j],
+                        b.cp_shomate_eqn[j])
 
-                if hasattr(blk[k], "enthalpy_shomate_eqn"):
+                if has_enthalpy_shomate:
                     calculate_variable_from_constraint(
-                            blk[k].enth_mol_comp[j],
-                            blk[k].enthalpy_shomate_eqn[j])
+                            b.enth_mol_comp[j],
+                            b.enthalpy_shomate_eqn[j])
 
         # Solve property block if non-empty
+        # Only need to know whether any block has free variables
         free_vars = 0
-        for k in blk.keys():
-            free_vars += number_unfixed_variables_in_activated_equalities(
-                blk[k])
+        for b in blk.values():
+            free_vars = number_unfixed_variables_in_activated_equalities(b)
+            if free_vars > 0:
+                break
 
         if free_vars > 0:
             with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
@@ -272,33 +272,35 @@ class _ReactionBlock(ReactionBlockBase):
         opt = get_solver(solver, optarg)
 
         # Initialise values
-        for k in blk.keys():
-            if hasattr(blk[k], "OC_conv_eqn"):
+        for b in blk.values():
+            if hasattr(b, "OC_conv_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].OC_conv,
-                            blk[k].OC_conv_eqn)
+                            b.OC_conv,
+                            b.OC_conv_eqn)
 
-            if hasattr(blk[k], "OC_conv_temp_eqn"):
+            if hasattr(b, "OC_conv_temp_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].OC_conv_temp,
-                            blk[k].OC_conv_temp_eqn)
+                            b.OC_conv_temp,
+                            b.OC_conv_temp_eqn)
 
-            for j in blk[k]._params.rate_reaction_idx:
-                if hasattr(blk[k], "rate_constant_eqn"):
+            for j in b._params.rate_reaction_idx:
+                if hasattr(b, "rate_constant_eqn"):
                     calculate_variable_from_constraint(
-                                blk[k].k_rxn[j],
-                                blk[k].rate_constant_eqn[j])
+                                b.k_rxn[j],
+                                b.rate_constant_eqn[j])
 
-                if hasattr(blk[k], "gen_rate_expression"):
+                if hasattr(b, "gen_rate_expression"):
                     calculate_variable_from_constraint(
-                            blk[k].reaction_rate[j],
-                            blk[k].gen_rate_expression[j])
+                            b.reaction_rate[j],
+                            b.gen_rate_expression[j])
 
         # Solve property block if non-empty
+        # Only need to know whether any block has free variables
         free_vars = 0
-        for k in blk.keys():
-            free_vars += number_unfixed_variables_in_activated_equalities(
-                blk[k])
+        for b in blk.values():
+            free_vars = number_unfixed_variables_in_activated_equalities(b)
+            if free_vars > 0:
+                break
 
         if free_vars > 0:
             with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
@@ -272,39 +272,46 @@ class _SolidPhaseThermoStateBlock(StateBlock):
 
         # ---------------------------------------------------------------------
         # Initialise values
-        for k in blk.keys():
-            if hasattr(blk[k], "density_skeletal_constraint"):
+        for b in blk.values():
+            if hasattr(b, "density_skeletal_constraint"):
                 calculate_variable_from_constraint(
-                            blk[k].dens_mass_skeletal,
-                            blk[k].density_skeletal_constraint)
+                            b.dens_mass_skeletal,
+                            b.density_skeletal_constraint)
 
-            if hasattr(blk[k], "mixture_heat_capacity_eqn"):
+            if hasattr(b, "mixture_heat_capacity_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].cp_mass,
-                            blk[k].mixture_heat_capacity_eqn)
+                            b.cp_mass,
+                            b.mixture_heat_capacity_eqn)
 
-            if hasattr(blk[k], "mixture_enthalpy_eqn"):
+            if hasattr(b, "mixture_enthalpy_eqn"):
                 calculate_variable_from_constraint(
-                            blk[k].enth_mass,
-                            blk[k].mixture_enthalpy_eqn)
+                            b.enth_mass,
+                            b.mixture_enthalpy_eqn)
+
+            # Check which component properties exist once per block rather
+            # than once per component
+            has_cp_shomate = hasattr(b, "cp_shomate_eqn")
+            has_enthalpy_shomate = hasattr(b, "enthalpy_shomate_eqn")
 
-            for j in blk[k]._params.component_list:
+            for j in b._params.component_list:
 
-                if hasattr(blk[k], "cp_shomate_eqn"):
-                    calculate_variable_from_constraint(blk[k].cp_mol_comp[j],
-                                                       blk[k].cp_shomate_eqn[j]
+                if has_cp_shomate:
+                    calculate_variable_from_constraint(b.cp_mol_comp[j],
+                                                       b.cp_shomate_eqn[j]
                                                        )
 
-                if hasattr(blk[k], "enthalpy_shomate_eqn"):
+                if has_enthalpy_shomate:
                     calculate_variable_from_constraint(
-                            blk[k].enth_mol_comp[j],
-                            blk[k].enthalpy_shomate_eqn[j])
+                            b.enth_mol_comp[j],
+                            b.enthalpy_shomate_eqn[j])
 
         # Solve property block if non-empty
+        # Only need to know whether any block has free variables
         free_vars = 0
-        for k in blk.keys():
-            free_vars += number_unfixed_variables_in_activated_equalities(
-                blk[k])
+        for b in blk.values():
+            free_vars = number_unfixed_variables_in_activated_equalities(b)
+            if free_vars > 0:
+                break
 
         if free_vars > 0:
             with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
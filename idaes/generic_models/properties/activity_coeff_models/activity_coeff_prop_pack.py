@@ -856,12 +856,14 @@ class ActivityCoeffStateBlockData(StateBlockData):
                                   rule=rule_fug_vap)
 
     def _fug_liq(self):
-        def rule_fug_liq(self, i):
-            if self.config.parameters.config.\
-                    activity_coeff_model == "Ideal":
+        # Choose the rule once, as the activity model is the same for all
+        # components
+        if self.config.parameters.config.activity_coeff_model == "Ideal":
+            def rule_fug_liq(self, i):
                 return self.mole_frac_phase_comp["Liq", i] * \
                     self.pressure_sat[i]
-            else:
+        else:
+            def rule_fug_liq(self, i):
                 return self.mole_frac_phase_comp["Liq", i] * \
                     self.activity_coeff_comp[i] * self.pressure_sat[i]
         self.fug_liq = Expression(self.params.component_list,
@@ -959,45 +961,32 @@ class ActivityCoeffStateBlockData(StateBlockData):
     def _enth_mol_comp_liq(self, j):
         # Liquid phase comp enthalpy (J/mol)
         # 1E3 conversion factor to convert from J/kmol to J/mol
+        params = self.params
+        T = self.temperature
+        T_ref = params.temperature_reference
         return self.enth_mol_phase_comp["Liq", j] == \
-            self.params.dh_form["Liq", j] + \
+            params.dh_form["Liq", j] + \
             pyunits.convert((
-                (self.params.cp_mol_liq_comp_coeff_E[j] / 5) *
-                (self.temperature**5 -
-                 self.params.temperature_reference**5)
-                + (self.params.cp_mol_liq_comp_coeff_D[j] / 4) *
-                  (self.temperature**4 -
-                   self.params.temperature_reference**4)
-                + (self.params.cp_mol_liq_comp_coeff_C[j] / 3) *
-                  (self.temperature**3 -
-                   self.params.temperature_reference**3)
-                + (self.params.cp_mol_liq_comp_coeff_B[j] / 2) *
-                  (self.temperature**2 -
-                   self.params.temperature_reference**2)
-                + self.params.cp_mol_liq_comp_coeff_A[j] *
-                  (self.temperature - self.params.temperature_reference)),
+                (params.cp_mol_liq_comp_coeff_E[j] / 5) * (T**5 - T_ref**5)
+                + (params.cp_mol_liq_comp_coeff_D[j] / 4) * (T**4 - T_ref**4)
+                + (params.cp_mol_liq_comp_coeff_C[j] / 3) * (T**3 - T_ref**3)
+                + (params.cp_mol_liq_comp_coeff_B[j] / 2) * (T**2 - T_ref**2)
+                + params.cp_mol_liq_comp_coeff_A[j] * (T - T_ref)),
                 to_units=pyunits.J/pyunits.mol)
 
     def _enth_mol_comp_vap(self, j):
 
         # Vapor phase component enthalpy (J/mol)
+        params = self.params
+        T = self.temperature
+        T_ref = params.temperature_reference
         return self.enth_mol_phase_comp["Vap", j] == \
-            self.params.dh_form["Vap", j] + \
-            ((self.params.cp_mol_vap_comp_coeff_E[j] / 5) *
-                (self.temperature**5 -
-                 self.params.temperature_reference**5)
-                + (self.params.cp_mol_vap_comp_coeff_D[j] / 4) *
-                  (self.temperature**4 -
-                   self.params.temperature_reference**4)
-                + (self.params.cp_mol_vap_comp_coeff_C[j] / 3) *
-                  (self.temperature**3 -
-                   self.params.temperature_reference**3)
-                + (self.params.cp_mol_vap_comp_coeff_B[j] / 2) *
-                  (self.temperature**2 -
-                   self.params.temperature_reference**2)
-                + self.params.cp_mol_vap_comp_coeff_A[j] *
-                  (self.temperature -
-                   self.params.temperature_reference))
+            params.dh_form["Vap", j] + \
+            ((params.cp_mol_vap_comp_coeff_E[j] / 5) * (T**5 - T_ref**5)
+             + (params.cp_mol_vap_comp_coeff_D[j] / 4) * (T**4 - T_ref**4)
+             + (params.cp_mol_vap_comp_coeff_C[j] / 3) * (T**3 - T_ref**3)
+             + (params.cp_mol_vap_comp_coeff_B[j] / 2) * (T**2 - T_ref**2)
+             + params.cp_mol_vap_comp_coeff_A[j] * (T - T_ref))
 
     def _entr_mol_phase(self):
         self.entr_mol_phase = Var(
@@ -1031,38 +1020,34 @@ class ActivityCoeffStateBlockData(StateBlockData):
     def _entr_mol_comp_liq(self, j):
         # Liquid phase comp entropy (J/mol.K)
         # 1E3 conversion factor to convert from J/kmol.K to J/mol.K
+        params = self.params
+        T = self.temperature
+        T_ref = params.temperature_reference
         return self.entr_mol_phase_comp['Liq', j] == (
-            self.params.ds_form["Liq", j] +
+            params.ds_form["Liq", j] +
             pyunits.convert((
-                (self.params.cp_mol_liq_comp_coeff_E[j] / 4) *
-                (self.temperature**4 - self.params.temperature_reference**4)
-                + (self.params.cp_mol_liq_comp_coeff_D[j] / 3) *
-                  (self.temperature**3 - self.params.temperature_reference**3)
-                + (self.params.cp_mol_liq_comp_coeff_C[j] / 2) *
-                  (self.temperature**2 - self.params.temperature_reference**2)
-                + self.params.cp_mol_liq_comp_coeff_B[j] *
-                  (self.temperature - self.params.temperature_reference)
-                + self.params.cp_mol_liq_comp_coeff_A[j] *
-                log(self.temperature / self.params.temperature_reference)),
+                (params.cp_mol_liq_comp_coeff_E[j] / 4) * (T**4 - T_ref**4)
+                + (params.cp_mol_liq_comp_coeff_D[j] / 3) * (T**3 - T_ref**3)
+                + (params.cp_mol_liq_comp_coeff_C[j] / 2) * (T**2 - T_ref**2)
+                + params.cp_mol_liq_comp_coeff_B[j] * (T - T_ref)
+                + params.cp_mol_liq_comp_coeff_A[j] * log(T / T_ref)),
                 to_units=pyunits.J/pyunits.mol/pyunits.K))
 
     def _entr_mol_comp_vap(self, j):
         # component molar entropy of vapor phase
+        params = self.params
+        T = self.temperature
+        T_ref = params.temperature_reference
         return self.entr_mol_phase_comp["Vap", j] == (
-            self.params.ds_form["Vap", j] +
-            ((self.params.cp_mol_vap_comp_coeff_E[j] / 4) *
-             (self.temperature**4 - self.params.temperature_reference**4)
-             + (self.params.cp_mol_vap_comp_coeff_D[j] / 3) *
-             (self.temperature**3 - self.params.temperature_reference**3)
-             + (self.params.cp_mol_vap_comp_coeff_C[j] / 2) *
-               (self.temperature**2 - self.params.temperature_reference**2)
-                + self.params.cp_mol_vap_comp_coeff_B[j] *
-               (self.temperature - self.params.temperature_reference)
-                + self.params.cp_mol_vap_comp_coeff_A[j] *
-                log(self.temperature / self.params.temperature_reference)) -
+            params.ds_form["Vap", j] +
+            ((params.cp_mol_vap_comp_coeff_E[j] / 4) * (T**4 - T_ref**4)
+             + (params.cp_mol_vap_comp_coeff_D[j] / 3) * (T**3 - T_ref**3)
+             + (params.cp_mol_vap_comp_coeff_C[j] / 2) * (T**2 - T_ref**2)
+             + params.cp_mol_vap_comp_coeff_B[j] * (T - T_ref)
+             + params.cp_mol_vap_comp_coeff_A[j] * log(T / T_ref)) -
             const.gas_constant * log(self.mole_frac_phase_comp['Vap', j] *
                                      self.pressure /
-                                     self.params.pressure_reference))
+                                     params.pressure_reference))
 
     def _gibbs_mol_phase_comp(self):
         self.gibbs_mol_phase_comp = Var(
@@ -1167,27 +1152,27 @@ class ActivityCoeffStateBlockData(StateBlockData):
 
 # -----------------------------------------------------------------------------
 # Bubble and Dew Points
+    def _pressure_sat_expr(self, j, T):
+        """
+        Expression for the saturation pressure of component j at temperature
+        T, shared by the bubble and dew point calculations.
+        """
+        # x is the reduced temperature term (1 - T/Tc)
+        x = 1 - T / self.params.temperature_critical[j]
+        return self.params.pressure_critical[j] * \
+            exp((self.params.pressure_sat_coeff[j, "A"] * x +
+                 self.params.pressure_sat_coeff[j, "B"] * x**1.5 +
+                 self.params.pressure_sat_coeff[j, "C"] * x**3 +
+                 self.params.pressure_sat_coeff[j, "D"] * x**6) /
+                (1 - x))
+
     def _temperature_bubble(self):
         self.temperature_bubble = Var(initialize=298.15,
                                       doc="Bubble point temperature (K)",
                                       units=pyunits.K)
 
         def rule_psat_bubble(m, j):
-            return self.params.pressure_critical[j] * \
-                exp((self.params.pressure_sat_coeff[j, "A"] *
-                    (1 - self.temperature_bubble /
-                    self.params.temperature_critical[j]) +
-                    self.params.pressure_sat_coeff[j, "B"] *
-                    (1 - self.temperature_bubble /
-                    self.params.temperature_critical[j])**1.5 +
-                    self.params.pressure_sat_coeff[j, "C"] *
-                    (1 - self.temperature_bubble /
-                    self.params.temperature_critical[j])**3 +
-                    self.params.pressure_sat_coeff[j, "D"] *
-                    (1 - self.temperature_bubble /
-                    self.params.temperature_critical[j])**6) /
-                    (1 - (1 - self.temperature_bubble /
-                          self.params.temperature_critical[j])))
+            return self._pressure_sat_expr(j, self.temperature_bubble)
 
         try:
             # Try to build expression
@@ -1320,21 +1305,7 @@ class ActivityCoeffStateBlockData(StateBlockData):
                                    units=pyunits.K)
 
         def rule_psat_dew(m, j):
-            return self.params.pressure_critical[j] * \
-                exp((self.params.pressure_sat_coeff[j, "A"] *
-                    (1 - self.temperature_dew /
-                    self.params.temperature_critical[j]) +
-                    self.params.pressure_sat_coeff[j, "B"] *
-                    (1 - self.temperature_dew /
-                    self.params.temperature_critical[j])**1.5 +
-                    self.params.pressure_sat_coeff[j, "C"] *
-                    (1 - self.temperature_dew /
-                    self.params.temperature_critical[j])**3 +
-                    self.params.pressure_sat_coeff[j, "D"] *
-                    (1 - self.temperature_dew /
-                    self.params.temperature_critical[j])**6) /
-                    (1 - (1 - self.temperature_dew /
-                          self.params.temperature_critical[j])))
+            return self._pressure_sat_expr(j, self.temperature_dew)
 
         try:
             # Try to build expression
@@ -1125,6 +1125,14 @@ class _GenericStateBlock(StateBlock):
                             temperature_crit.value
                             for j in valid_comps) - 1
 
+                    # Look up the Psat method and component object for each
+                    # component once, as they do not change between iterations
+                    psat_methods = [
+                        (j,
+                         get_method(blk[k], "pressure_sat_comp", j),
+                         blk[k].params.get_component(j))
+                        for j in valid_comps]
+
                     err = 1
                     counter = 0
 
@@ -1132,27 +1140,25 @@ class _GenericStateBlock(StateBlock):
                     # Tolerance only needs to be ~1e-1
                     # Iteration limit of 30
                     while err > 1e-1 and counter < 30:
+                        # Evaluate Psat once per component and share it
+                        # between the residual and its derivative
+                        psat = {j: value(psat_method(blk[k],
+                                                     cobj,
+                                                     Tdew0*T_units))
+                                for j, psat_method, cobj in psat_methods}
                         f = value(
                             blk[k].pressure *
-                            sum(blk[k].mole_frac_comp[j] /
-                                get_method(blk[k], "pressure_sat_comp", j)(
-                                           blk[k],
-                                           blk[k].params.get_component(j),
-                                           Tdew0*T_units)
+                            sum(blk[k].mole_frac_comp[j] / psat[j]
                                 for j in valid_comps) - 1)
                         df = -value(
                                 blk[k].pressure *
                                 sum(blk[k].mole_frac_comp[j] /
-                                    get_method(blk[k], "pressure_sat_comp", j)(
-                                           blk[k],
-                                           blk[k].params.get_component(j),
-                                           Tdew0*T_units)**2 *
-                                    get_method(blk[k], "pressure_sat_comp", j)(
-                                           blk[k],
-                                           blk[k].params.get_component(j),
-                                           Tdew0*T_units,
-                                           dT=True)
-                                    for j in valid_comps))
+                                    psat[j]**2 *
+                                    psat_method(blk[k],
+                                                cobj,
+                                                Tdew0*T_units,
+                                                dT=True)
+                                    for j, psat_method, cobj in psat_methods))
 
                         # Limit temperature step to avoid excessive overshoot
                         if f/df < -50:
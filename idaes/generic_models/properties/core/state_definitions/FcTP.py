@@ -172,12 +172,14 @@ def define_state(b):
                                                rule=rule_comp_mass_balance)
 
         def rule_mole_frac(b):
-            return sum(b.mole_frac_phase_comp[b.phase_list[1], i]
+            p1 = b.phase_list[1]
+            p2 = b.phase_list[2]
+            return sum(b.mole_frac_phase_comp[p1, i]
                        for i in b.component_list
-                       if (b.phase_list[1], i) in b.phase_component_set) -\
-                sum(b.mole_frac_phase_comp[b.phase_list[2], i]
+                       if (p1, i) in b.phase_component_set) -\
+                sum(b.mole_frac_phase_comp[p2, i]
                     for i in b.component_list
-                    if (b.phase_list[2], i) in b.phase_component_set) == 0
+                    if (p2, i) in b.phase_component_set) == 0
         b.sum_mole_frac = Constraint(rule=rule_mole_frac)
 
         def rule_phase_frac(b, p):
@@ -339,37 +339,46 @@ class VaporStateBlockMethods(StateBlock):
         opt = get_solver(solver, optarg)
 
         # ---------------------------------------------------------------------
-        # Initialise values
-        for k in blk.keys():
-            for j in blk[k].component_list:
-                if hasattr(blk[k], "cp_mol_comp_eqn"):
-                    calculate_variable_from_constraint(blk[k].cp_mol_comp[j],
-                                                       blk[k].cp_mol_comp_eqn[j])
-
-                if hasattr(blk[k], "flow_mol_comp_eqn"):
-                    calculate_variable_from_constraint(blk[k].flow_mol_comp[j],
-                                                       blk[k].flow_mol_comp_eqn[j])
-
-                if hasattr(blk[k], "cp_mol_comp_mean_eqn"):
-                    calculate_variable_from_constraint(blk[k].cp_mol_comp_mean[j],
-                                                       blk[k].cp_mol_comp_mean_eqn[j])
-
-            if hasattr(blk[k], "cp_mol_eqn"):
-                calculate_variable_from_constraint(blk[k].cp_mol,
-                                                   blk[k].cp_mol_eqn)
-
-            if hasattr(blk[k], "cp_mol_mean_eqn"):
-                calculate_variable_from_constraint(blk[k].cp_mol_mean,
-                                                   blk[k].cp_mol_mean_eqn)
-
-            if hasattr(blk[k], "enth_mean_eqn"):
-                calculate_variable_from_constraint(blk[k].enth_mean,
-                                                   blk[k].enth_mean_eqn)
+        # Initialise values and count free variables in a single pass
+        free_vars = 0
+        for b in blk.values():
+            # Check which component properties exist once per block rather
+            # than once per component
+            has_cp_mol_comp = hasattr(b, "cp_mol_comp_eqn")
+            has_flow_mol_comp = hasattr(b, "flow_mol_comp_eqn")
+            has_cp_mol_comp_mean = hasattr(b, "cp_mol_comp_mean_eqn")
+
+            for j in b.component_list:
+                if has_cp_mol_comp:
+                    calculate_variable_from_constraint(b.cp_mol_comp[j],
+                                                       b.cp_mol_comp_eqn[j])
+
+                if has_flow_mol_comp:
+                    calculate_variable_from_constraint(b.flow_mol_comp[j],
+                                                       b.flow_mol_comp_eqn[j])
+
+                if has_cp_mol_comp_mean:
+                    calculate_variable_from_constraint(b.cp_mol_comp_mean[j],
+                                                       b.cp_mol_comp_mean_eqn[j])
+
+            if hasattr(b, "cp_mol_eqn"):
+                calculate_variable_from_constraint(b.cp_mol,
+                                                   b.cp_mol_eqn)
+
+            if hasattr(b, "cp_mol_mean_eqn"):
+                calculate_variable_from_constraint(b.cp_mol_mean,
+                                                   b.cp_mol_mean_eqn)
+
+            if hasattr(b, "enth_mean_eqn"):
+                calculate_variable_from_constraint(b.enth_mean,
+                                                   b.enth_mean_eqn)
+
+            # Only need to know if any block has free variables, so skip
+            # the count once one has been found
+            if free_vars == 0:
+                free_vars = number_unfixed_variables(b)
 
         # Solve property block if non-empty
-        free_vars = 0
-        for k in blk.keys():
-            free_vars += number_unfixed_variables(blk[k])
         if free_vars > 0:
             with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
                 res = solve_indexed_blocks(opt, [blk], tee=slc.tee)
@@ -25,7 +25,7 @@ of state.
 """
 # Import Python libraries
 import logging
-import copy
+from itertools import product
 
 # Import Pyomo units
 import pyomo.environ as pyo
@@ -396,6 +396,19 @@ _component_params = {
 }
 
 
+def _copy_config(d):
+    """
+    Copy the dicts and lists in a nested configuration dictionary, sharing
+    the leaves (numbers, tuples, classes and units) rather than deep copying
+    them.
+    """
+    if isinstance(d, dict):
+        return {k: _copy_config(v) for k, v in d.items()}
+    if isinstance(d, list):
+        return [_copy_config(v) for v in d]
+    return d
+
+
 # returns a configuration dictionary for the list of specified components
 def get_prop(components=None, phases="Vap"):
     if components is None:
@@ -422,11 +435,11 @@ def get_prop(components=None, phases="Vap"):
 
     c = configuration["components"]
     for comp in components:
-        c[comp] = copy.deepcopy(_component_params[comp])
+        c[comp] = _copy_config(_component_params[comp])
     if isinstance(phases, str):
         phases = [phases]
     for k in phases:
-        configuration["phases"][k] = copy.deepcopy(_phase_dicts[k])
+        configuration["phases"][k] = _copy_config(_phase_dicts[k])
     if len(phases) > 1:
         p = tuple(phases)
         configuration["phases_in_equilibrium"] = [p]
@@ -434,7 +447,7 @@ def get_prop(components=None, phases="Vap"):
 
     # Fill the binary parameters with zeros.
     d = configuration["parameter_data"]
-    d["PR_kappa"] = {(a, b):0 for a in c for b in c}
+    d["PR_kappa"] = dict.fromkeys(product(c, repeat=2), 0)
     return configuration
 
 def get_rxn(property_package, reactions=None):
@@ -185,3 +185,17 @@ class TestNaturalGasProps(object):
 
         assert -634e6 == pytest.approx(value(
             m.fs.reactor.heat_duty[0]), 1e-3)
+
+
+@pytest.mark.unit
+def test_get_prop_returns_independent_config():
+    config = get_prop(components=['H2O', 'CO2'], phases=["Vap", "Liq"])
+    config["components"]["H2O"]["parameter_data"]["omega"] = 0
+    config["components"]["H2O"]["valid_phase_types"].clear()
+    config["phases"]["Vap"]["equation_of_state_options"]["type"] = None
+
+    fresh = get_prop(components=['H2O', 'CO2'], phases=["Vap", "Liq"])
+    assert fresh["components"]["H2O"]["parameter_data"]["omega"] == 0.344
+    assert len(fresh["components"]["H2O"]["valid_phase_types"]) == 2
+    assert fresh["phases"]["Vap"]["equation_of_state_options"]["type"] \
+        is not None